@@ -12,8 +12,4 @@ class Statement(AstNode):
     pass
 
 
-class Expression(AstNode):
-    pass
-
-
-__all__ = ["AstNode", "Statement", "Expression"]
+__all__ = ["AstNode", "Statement"]
@@ -1,6 +1,6 @@
 import typing
+from typing import Final
 import enum
-from front.ast import Expression
 
 
 class ConstantKind(enum.IntEnum):
@@ -40,96 +40,74 @@ class BinaryOperatorKind(enum.IntEnum):
 
 
 
-class Constant(Expression):
-    kind: ConstantKind
-    value: typing.Any
+UNARY_OPERATOR_STRINGS: Final[dict[UnaryOperatorKind, str]] = {
+    UnaryOperatorKind.Negate: "-", UnaryOperatorKind.Posate: "+",
+    UnaryOperatorKind.Flip: "!", UnaryOperatorKind.Invert: "~"
+}
+BINARY_OPERATOR_STRINGS: Final[dict[BinaryOperatorKind, str]] = {
+    BinaryOperatorKind.Add: "+", BinaryOperatorKind.Subtract: "-",
+    BinaryOperatorKind.Multiply: "*", BinaryOperatorKind.Divide: "/",
+    BinaryOperatorKind.Modulo: "%", BinaryOperatorKind.Bitand: "&",
+    BinaryOperatorKind.Bitxor: "^", BinaryOperatorKind.Bitor: "|",
+    BinaryOperatorKind.LShift: "<<", BinaryOperatorKind.RShift: ">>",
+    BinaryOperatorKind.CmpGreater: ">", BinaryOperatorKind.CmpGreaterEqual: ">=",
+    BinaryOperatorKind.CmpLesser: "<", BinaryOperatorKind.CmpLesserEqual: "<=",
+    BinaryOperatorKind.CmpEqual: "==", BinaryOperatorKind.CmpInEqual: "!="
+}
 
-    __slots__ = "kind", "value"
 
-    def __init__(self, k: ConstantKind, v: typing.Any):
-        super().__init__()
-        self.kind = k
-        self.value = v
+# Expression nodes are NamedTuples, so == and hash() are structural like any tuple's: nodes of
+# different classes with equal fields compare equal (Identifier("a") == ("a",)), and IntEnum kinds
+# compare as their int values. Use `is` to test whether two nodes are the same node.
+class Constant(typing.NamedTuple):
+    kind: ConstantKind
+    value: typing.Any
 
     def __repr__(self):
         return repr(self.value)
 
 
-class Identifier(Expression):
+class Identifier(typing.NamedTuple):
     name: str
 
-    __slots__ = "name"
-
-    def __init__(self, name: str):
-        super().__init__()
-        self.name = name
-
     def __repr__(self):
         return self.name
 
 
-class UnaryOperator(Expression):
+class UnaryOperator(typing.NamedTuple):
     operator: UnaryOperatorKind
-    expr: Expression
+    expr: typing.Optional["Expression"]
 
-    __slots__ = "operator", "expr"
+    def __repr__(self):
+        return f"{UNARY_OPERATOR_STRINGS[self.operator]}{self.expr}"
 
-    operator_strings: dict[UnaryOperatorKind, str] = {
-        UnaryOperatorKind.Negate: "-", UnaryOperatorKind.Posate: "+",
-        UnaryOperatorKind.Flip: "!", UnaryOperatorKind.Invert: "~"
-    }
 
-    def __init__(self, operator: UnaryOperatorKind, expr: Expression):
-        super().__init__()
-        self.expr = expr
-        self.operator = operator
+class BinaryOperator(typing.NamedTuple):
+    lhs: typing.Optional["Expression"]
+    operator: BinaryOperatorKind
+    rhs: typing.Optional["Expression"]
 
     def __repr__(self):
-        return f"{self.operator_strings[self.operator]}{self.expr}"
+        return f"({self.lhs} {BINARY_OPERATOR_STRINGS[self.operator]} {self.rhs})"
 
 
-class BinaryOperator(Expression):
-    operator: BinaryOperatorKind
-    lhs: Expression
-    rhs: Expression
-
-    __slots__ = "lhs", "rhs", "operator"
-
-    operator_strings: dict[BinaryOperatorKind, str] = {
-        BinaryOperatorKind.Add: "+", BinaryOperatorKind.Subtract: "-",
-        BinaryOperatorKind.Multiply: "*", BinaryOperatorKind.Divide: "/",
-        BinaryOperatorKind.Modulo: "%", BinaryOperatorKind.Bitand: "&",
-        BinaryOperatorKind.Bitxor: "^", BinaryOperatorKind.Bitor: "|",
-        BinaryOperatorKind.LShift: "<<", BinaryOperatorKind.RShift: ">>",
-        BinaryOperatorKind.CmpGreater: ">", BinaryOperatorKind.CmpGreaterEqual: ">=",
-        BinaryOperatorKind.CmpLesser: "<", BinaryOperatorKind.CmpLesserEqual: "<=",
-        BinaryOperatorKind.CmpEqual: "==", BinaryOperatorKind.CmpInEqual: "!="
-    }
-
-    def __init__(self, lhs: Expression, operator: BinaryOperatorKind, rhs: Expression):
-        super().__init__()
-        self.lhs = lhs
-        self.rhs = rhs
-        self.operator = operator
+class TernaryOperator(typing.NamedTuple):
+    condition: "Expression"
+    if_clause: "Expression"
+    else_clause: "Expression"
 
     def __repr__(self):
-        return f"({self.lhs} {self.operator_strings[self.operator]} {self.rhs})"
-
+        return f"({self.if_clause} if {self.condition} else {self.else_clause})"
 
-class TernaryOperator(Expression):
-    condition: Expression
-    if_clause: Expression
-    else_clause: Expression
 
-    __slots__ = "condition", "if_clause", "else_clause"
+# Expression nodes don't share a base class, so Expression is their union.
+Expression = typing.Union[Constant, Identifier, UnaryOperator, BinaryOperator, TernaryOperator]
 
-    def __init__(self, cond: Expression, if_: Expression, else_: Expression):
-        self.condition = cond
-        self.if_clause = if_
-        self.else_clause = else_
 
-    def __repr__(self):
-        return f"({self.if_clause} if {self.condition} else {self.else_clause})"
+__all__ = ["ConstantKind", "UnaryOperatorKind", "BinaryOperatorKind",
+           "UNARY_OPERATOR_STRINGS", "BINARY_OPERATOR_STRINGS",
+           "Constant", "Identifier", "UnaryOperator", "BinaryOperator", "TernaryOperator",
+           "Expression"]
 
 
 
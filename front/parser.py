@@ -1,11 +1,18 @@
 from dataclasses import dataclass
-from front.token import Token, TokenType, Tokenizer, UnknownCharacterError
-from front.ast import Expression, Statement, AstNode
-from front.expression import *
+from front.token import *
+from front.ast import Statement, AstNode
+# Imported by name: mypyc-compiled modules don't bind names from star imports at runtime,
+# and the NamedTuple expression nodes are looked up as globals.
+from front.expression import (ConstantKind, UnaryOperatorKind, BinaryOperatorKind, Constant, Identifier,
+                              UnaryOperator, BinaryOperator, Expression)
 from front.statement import *
 from front.types import *
 from collections import namedtuple
+import typing
+from typing import Final
+import contextlib
 import enum
+import gc
 
 
 
@@ -14,162 +21,242 @@ class SymbolEntryKind(enum.IntEnum):
     Type = enum.auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class SymbolEntry:
     kind: SymbolEntryKind
     type: QualifiedType
 
-    __slots__ = "kind", "type"
 
-
-@dataclass
+@dataclass(slots=True)
 class OpInfo:
     precedence: int
     left_associativity: bool
     kind: BinaryOperatorKind
 
-    __slots__ = "precedence", "left_associativity", "kind"
+
+# Maps the kind stored in a packed operator back to its enum member.
+BINARY_KINDS: Final[dict[int, BinaryOperatorKind]] = {int(kind): kind for kind in BinaryOperatorKind}
+
+
+# Operators are packed into one int: (kind << 16) | ((precedence + 128) << 8) | (next_prec + 128),
+# where next_prec is the minimum precedence of the right-hand side. Tokens that are not binary
+# operators map to -1.
+def pack_operator(info: OpInfo) -> int:
+    next_prec: int = info.precedence + (1 if info.left_associativity else 0)
+    assert -128 <= info.precedence and next_prec < 128, "Operator precedence must fit in 8 bits"
+    return (info.kind << 16) | ((info.precedence + 128) << 8) | (next_prec + 128)
+
+
+def build_operator_table(operator_map: dict[int, OpInfo]) -> list[int]:
+    table: list[int] = [-1] * (max(TokenType) + 1)
+    for tp, info in operator_map.items():
+        table[tp] = pack_operator(info)
+    return table
+
 
 
+@contextlib.contextmanager
+def gc_paused() -> typing.Iterator[None]:
+    # Syntax trees are acyclic, so pausing the process-wide collector around a parse only skips useless passes.
+    gc_enabled: bool = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if gc_enabled:
+            gc.enable()
 
 
 class Parser:
 
-    operator_map = {
-        TokenType.Star: OpInfo(0, True, BinaryOperatorKind.Multiply),
-        TokenType.Slash: OpInfo(0, True, BinaryOperatorKind.Divide),
-        TokenType.Percent: OpInfo(0, True, BinaryOperatorKind.Modulo),
+    operator_map: Final[dict[int, OpInfo]] = {
+        TT_STAR: OpInfo(0, True, BinaryOperatorKind.Multiply),
+        TT_SLASH: OpInfo(0, True, BinaryOperatorKind.Divide),
+        TT_PERCENT: OpInfo(0, True, BinaryOperatorKind.Modulo),
 
-        TokenType.Plus: OpInfo(-1, True, BinaryOperatorKind.Add),
-        TokenType.Minus: OpInfo(-1, True, BinaryOperatorKind.Subtract),
+        TT_PLUS: OpInfo(-1, True, BinaryOperatorKind.Add),
+        TT_MINUS: OpInfo(-1, True, BinaryOperatorKind.Subtract),
 
-        TokenType.LShift: OpInfo(-2, True, BinaryOperatorKind.LShift),
-        TokenType.RShift: OpInfo(-2, True, BinaryOperatorKind.RShift),
+        TT_LSHIFT: OpInfo(-2, True, BinaryOperatorKind.LShift),
+        TT_RSHIFT: OpInfo(-2, True, BinaryOperatorKind.RShift),
 
-        TokenType.Greater: OpInfo(-3, True, BinaryOperatorKind.CmpGreater),
-        TokenType.GreaterEqual: OpInfo(-3, True, BinaryOperatorKind.CmpGreaterEqual),
-        TokenType.Lesser: OpInfo(-3, True, BinaryOperatorKind.CmpLesser),
-        TokenType.LesserEqual: OpInfo(-3, True, BinaryOperatorKind.CmpLesserEqual),
+        TT_GREATER: OpInfo(-3, True, BinaryOperatorKind.CmpGreater),
+        TT_GREATER_EQUAL: OpInfo(-3, True, BinaryOperatorKind.CmpGreaterEqual),
+        TT_LESSER: OpInfo(-3, True, BinaryOperatorKind.CmpLesser),
+        TT_LESSER_EQUAL: OpInfo(-3, True, BinaryOperatorKind.CmpLesserEqual),
 
-        TokenType.Equal: OpInfo(-4, True, BinaryOperatorKind.CmpEqual),
-        TokenType.BangEqual: OpInfo(-4, True, BinaryOperatorKind.CmpInEqual),
+        TT_EQUAL: OpInfo(-4, True, BinaryOperatorKind.CmpEqual),
+        TT_BANG_EQUAL: OpInfo(-4, True, BinaryOperatorKind.CmpInEqual),
 
-        TokenType.Ampersand: OpInfo(-5, True, BinaryOperatorKind.Bitand),
-        TokenType.Caret: OpInfo(-6, True, BinaryOperatorKind.Bitxor),
-        TokenType.Pipe: OpInfo(-7, True, BinaryOperatorKind.Bitor),
+        TT_AMPERSAND: OpInfo(-5, True, BinaryOperatorKind.Bitand),
+        TT_CARET: OpInfo(-6, True, BinaryOperatorKind.Bitxor),
+        TT_PIPE: OpInfo(-7, True, BinaryOperatorKind.Bitor),
     }
+    op_table: Final[list[int]] = build_operator_table(operator_map)
 
     source_code: str
-    tokenizer: Tokenizer
-    token: Token
+    tokens: bytearray
+    tok_values: list[typing.Any]
+    pos: int  # byte offset of the current TOKEN_RECORD in tokens
     errors: list[str]
-    symbol_table: list[dict[str, SymbolEntry]]
+    symbols: dict[str, list[SymbolEntry]]
+    scope_marks: list[list[str]]
+    void_type: QualifiedType
+    # Single-entry memo of the last error-free parse_atom call, keyed by its start position.
+    atom_cache_pos: int
+    atom_cache_end: int
+    atom_cache_node: typing.Optional[Expression]
 
-    __slots__ = "source_code", "tokenizer", "token", "errors", "symbol_table", "void_type"
+    __slots__ = "source_code", "tokens", "tok_values", "pos", "errors", "symbols", "scope_marks", "void_type",\
+                "atom_cache_pos", "atom_cache_end", "atom_cache_node"
 
     def __init__(self, text: str):
         self.source_code = text
-        self.tokenizer = Tokenizer(text)
-        self.token = self.tokenizer()
+        self.tokens, self.tok_values = tokenize_all(text)
+        self.pos = 0
+        self.atom_cache_pos = -1
+        self.atom_cache_end = -1
+        self.atom_cache_node = None
         self.errors = []
         self.void_type = QualifiedType(VoidType())
-        self.symbol_table = [{}]
-        self.symbol_table[-1]["i32"] = SymbolEntry(SymbolEntryKind.Type, QualifiedType(IntegerType(32), 0))
+        self.symbols = {}
+        self.scope_marks = [[]]
+        self.declare_symbol("i32", SymbolEntry(SymbolEntryKind.Type, QualifiedType(IntegerType(32), 0)))
 
 
     def search_symbol(self, key: str) -> typing.Optional[SymbolEntry]:
-        for d in reversed(self.symbol_table):
-            e: SymbolEntry = d.get(key, None)
-            if e is not None:
-                return e
-        return None
-
-    def enter_scope(self):
-        self.symbol_table.append({})
-
-    def leave_scope(self):
-        self.symbol_table.pop()
-
-    def advance(self) -> Token:
-        t: Token = self.token
-        self.token = self.tokenizer()
-        return t
-
-    def match(self, tp: TokenType) -> bool:
-        if self.token.type == tp:
-            self.token = self.tokenizer()
-            return True
-        else:
-            return False
+        chain: typing.Optional[list[SymbolEntry]] = self.symbols.get(key)
+        return chain[-1] if chain else None
 
-    def consume(self, t: TokenType, s: str) -> bool:
-        if self.token.type == t:
-            self.token = self.tokenizer()
-            return True
+    def declare_symbol(self, key: str, entry: SymbolEntry) -> None:
+        chain: typing.Optional[list[SymbolEntry]] = self.symbols.get(key)
+        if chain is None:
+            self.symbols[key] = [entry]
         else:
+            chain.append(entry)
+        self.scope_marks[-1].append(key)
+
+    def enter_scope(self) -> None:
+        self.scope_marks.append([])
+
+    def leave_scope(self) -> None:
+        for key in self.scope_marks.pop():
+            chain: list[SymbolEntry] = self.symbols[key]
+            chain.pop()
+            if not chain:
+                del self.symbols[key]
+
+    def peek_value(self) -> typing.Any:
+        return self.tok_values[TOKEN_RECORD.unpack_from(self.tokens, self.pos)[1]]
+
+    def advance(self) -> tuple[int, typing.Any]:
+        tp, value_idx, _ = TOKEN_RECORD.unpack_from(self.tokens, self.pos)
+        self.pos += TOKEN_SIZE
+        return tp, self.tok_values[value_idx]
+
+    def match(self, tp: int) -> bool:
+        hit: bool = self.tokens[self.pos] == tp
+        self.pos += hit * TOKEN_SIZE
+        return hit
+
+    def consume(self, t: int, s: str) -> bool:
+        hit: bool = self.tokens[self.pos] == t
+        self.pos += hit * TOKEN_SIZE
+        if not hit:
             self.errors.append(s)
-            return False
+        return hit
 
-    def parse_parenthesis(self) -> Expression:
-        e: Token = self.parse_expression()
-        self.consume(TokenType.RParen, "Expected ')' after expression in parenthesis")
+    def parse_parenthesis(self) -> typing.Optional[Expression]:
+        e: typing.Optional[Expression] = self.parse_expression()
+        self.consume(TT_RPAREN, "Expected ')' after expression in parenthesis")
         return e
 
-    def parse_atom(self) -> Expression:
-        token: Token = self.token
-        if self.match(TokenType.Identifier):
-            return Identifier(token.value)
-        elif self.match(TokenType.IntLiteral):
-            return Constant(ConstantKind.Int, token.value)
-        elif self.match(TokenType.StringLiteral):
-            return Constant(ConstantKind.String, token.value)
-        elif self.match(TokenType.Minus):
-            return UnaryOperator(UnaryOperatorKind.Negate, self.parse_atom())
-        elif self.match(TokenType.Plus):
-            return UnaryOperator(UnaryOperatorKind.Posate, self.parse_atom())
-        elif self.match(TokenType.Bang):
-            return UnaryOperator(UnaryOperatorKind.Flip, self.parse_atom())
-        elif self.match(TokenType.Tilde):
-            return UnaryOperator(UnaryOperatorKind.Invert, self.parse_atom())
-        elif self.match(TokenType.LParen):
-            return self.parse_parenthesis()
-
-    def parse_expression(self, min_prec: int = -1000) -> Expression:
-        lhs: Expression = self.parse_atom()
-
-        while self.token.type in self.operator_map:
-            if self.operator_map[self.token.type].precedence < min_prec:
-                break
-
-            info = self.operator_map[self.token.type]
-            self.advance()
-            next_prec = info.precedence + int(info.left_associativity)
-            rhs = self.parse_expression(next_prec)
-            lhs = BinaryOperator(lhs, info.kind, rhs)
-
-        return lhs
-
-    def parse_block(self) -> Statement:
+    def parse_atom(self) -> typing.Optional[Expression]:
+        start: int = self.pos
+        if start == self.atom_cache_pos:
+            self.pos = self.atom_cache_end
+            return self.atom_cache_node
+        error_count: int = len(self.errors)
+
+        # match() is inlined here and in parse_statement: both run once per atom or statement.
+        tp: int = self.tokens[start]
+        node: typing.Optional[Expression] = None
+        if tp == TT_IDENTIFIER:
+            node = Identifier(self.peek_value())
+            self.pos = start + TOKEN_SIZE
+        elif tp == TT_INT_LITERAL:
+            node = Constant(ConstantKind.Int, self.peek_value())
+            self.pos = start + TOKEN_SIZE
+        elif tp == TT_STRING_LITERAL:
+            node = Constant(ConstantKind.String, self.peek_value())
+            self.pos = start + TOKEN_SIZE
+        elif tp == TT_MINUS:
+            self.pos = start + TOKEN_SIZE
+            node = UnaryOperator(UnaryOperatorKind.Negate, self.parse_atom())
+        elif tp == TT_PLUS:
+            self.pos = start + TOKEN_SIZE
+            node = UnaryOperator(UnaryOperatorKind.Posate, self.parse_atom())
+        elif tp == TT_BANG:
+            self.pos = start + TOKEN_SIZE
+            node = UnaryOperator(UnaryOperatorKind.Flip, self.parse_atom())
+        elif tp == TT_TILDE:
+            self.pos = start + TOKEN_SIZE
+            node = UnaryOperator(UnaryOperatorKind.Invert, self.parse_atom())
+        elif tp == TT_LPAREN:
+            self.pos = start + TOKEN_SIZE
+            node = self.parse_parenthesis()
+
+        # Atoms that recorded errors are not cached: a hit would not record them again.
+        if len(self.errors) == error_count:
+            self.atom_cache_pos = start
+            self.atom_cache_end = self.pos
+            self.atom_cache_node = node
+        return node
+
+    def parse_expression(self, min_prec: int = -1000) -> typing.Optional[Expression]:
+        op_table: list[int] = self.op_table
+        binary_kinds: dict[int, BinaryOperatorKind] = BINARY_KINDS
+        tokens: bytearray = self.tokens
+        # Pending left operands, each with its operator kind and the minimum precedence to
+        # restore once its right-hand side is complete.
+        stack: list[tuple[typing.Optional[Expression], int, int]] = []
+        lhs: typing.Optional[Expression] = self.parse_atom()
+
+        while True:
+            code: int = op_table[tokens[self.pos]]
+            if code < 0 or ((code >> 8) & 0xFF) - 128 < min_prec:
+                if not stack:
+                    return lhs
+                outer, kind, min_prec = stack.pop()
+                lhs = BinaryOperator(outer, binary_kinds[kind], lhs)
+                continue
+
+            self.pos += TOKEN_SIZE
+            stack.append((lhs, code >> 16, min_prec))
+            min_prec = (code & 0xFF) - 128
+            lhs = self.parse_atom()
+
+    def parse_block(self) -> StatementBlock:
         statements: list[Statement] = []
-        while not self.match(TokenType.RBrace):
+        while not self.match(TT_RBRACE):
             statements.append(self.parse_statement())
         return StatementBlock(statements)
 
     def parse_if(self) -> Statement:
-        self.consume(TokenType.LParen, "Expected '(' after if statement")
+        self.consume(TT_LPAREN, "Expected '(' after if statement")
         condition = self.parse_expression()
-        self.consume(TokenType.RParen, "Expected ')' after if's condition")
+        self.consume(TT_RPAREN, "Expected ')' after if's condition")
         if_clause = self.parse_statement()
         else_clause = None
-        if self.match(TokenType.ElseKW):
+        if self.match(TT_ELSE_KW):
             else_clause = self.parse_statement()
 
         return IfStatement(condition, if_clause, else_clause)
     
     def parse_type_expression(self) -> QualifiedType:
-        name: str = self.token.value
-        self.consume(TokenType.Identifier, "Type must be an identifier")
-        entry: SymbolEntry = self.search_symbol(name)
+        name: str = self.peek_value()
+        self.consume(TT_IDENTIFIER, "Type must be an identifier")
+        entry: typing.Optional[SymbolEntry] = self.search_symbol(name)
         if entry is None:
             self.errors.append(f"No type found with name {name}")
             return self.void_type
@@ -177,73 +264,78 @@ class Parser:
             self.errors.append("Non-type symbol used as a type expression")
             return self.void_type
 
-        if self.match(TokenType.Ampersand):
+        if self.match(TT_AMPERSAND):
             return entry.type.add_flags(QualifiedType.Reference)
         else:
             return entry.type
 
     def parse_variable_declaration(self) -> VariableDeclaration:
-        name = self.token.value
-        self.consume(TokenType.Identifier, "Variable declaration must have a name!")
-        self.consume(TokenType.Colon, "Expected ':' after variable declaration name")
+        name = self.peek_value()
+        self.consume(TT_IDENTIFIER, "Variable declaration must have a name!")
+        self.consume(TT_COLON, "Expected ':' after variable declaration name")
         tp = self.parse_type_expression()
-        init: Expression = None
-        if self.match(TokenType.Equal):
+        init: typing.Optional[Expression] = None
+        if self.match(TT_EQUAL):
             init = self.parse_expression()
-        self.consume(TokenType.Semicolon, "Expected ';' after variable declaration")
+        self.consume(TT_SEMICOLON, "Expected ';' after variable declaration")
         return VariableDeclaration(name, tp, init)
 
     def parse_function_definition(self) -> FunctionDefinition:
-        name = self.token.value
+        name = self.peek_value()
         arg_names = []
         arg_types = []
 
-        self.consume(TokenType.Identifier, "Function definition must have a name!")
-        self.consume(TokenType.LParen, "Expected '(' after function name")
+        self.consume(TT_IDENTIFIER, "Function definition must have a name!")
+        self.consume(TT_LPAREN, "Expected '(' after function name")
 
-        while self.token.type == TokenType.Identifier:
-            arg_name = self.advance().value
-            self.consume(TokenType.Colon, "Expected ':' after function parameter name")
+        while self.tokens[self.pos] == TT_IDENTIFIER:
+            arg_name = self.advance()[1]
+            self.consume(TT_COLON, "Expected ':' after function parameter name")
             arg_type = self.parse_type_expression()
             arg_names.append(arg_name)
             arg_types.append(arg_type)
-            if not self.match(TokenType.Comma):
+            if not self.match(TT_COMMA):
                 break
 
-        self.consume(TokenType.RParen, "Expected ')' after function arguments")
-        self.consume(TokenType.Arrow, "Expected '->' after function arguments")
+        self.consume(TT_RPAREN, "Expected ')' after function arguments")
+        self.consume(TT_ARROW, "Expected '->' after function arguments")
         ret_tp = self.parse_type_expression()
         func_type = FunctionType(ret_tp, arg_types)
-        if self.match(TokenType.Semicolon):
+        if self.match(TT_SEMICOLON):
             return FunctionDefinition(name, func_type, arg_names, None)
         else:
-            self.consume(TokenType.LBrace, "Expected '{' after function definition")
+            self.consume(TT_LBRACE, "Expected '{' after function definition")
             code = self.parse_block()
             return FunctionDefinition(name, func_type, arg_names, code)
 
 
     def parse_statement(self) -> Statement:
-
-        if self.match(TokenType.ReturnKW):
+        tp: int = self.tokens[self.pos]
+        if tp == TT_RETURN_KW:
+            self.pos += TOKEN_SIZE
             stmt: Statement = ReturnStatement(self.parse_expression())
-            self.consume(TokenType.Semicolon, "Expected ';' after return statement")
+            self.consume(TT_SEMICOLON, "Expected ';' after return statement")
             return stmt
-        elif self.match(TokenType.FnKW):
+        elif tp == TT_FN_KW:
+            self.pos += TOKEN_SIZE
             return self.parse_function_definition()
-        elif self.match(TokenType.VarKW):
+        elif tp == TT_VAR_KW:
+            self.pos += TOKEN_SIZE
             return self.parse_variable_declaration()
-        elif self.match(TokenType.IfKW):
+        elif tp == TT_IF_KW:
+            self.pos += TOKEN_SIZE
             return self.parse_if()
-        elif self.match(TokenType.LBrace):
+        elif tp == TT_LBRACE:
+            self.pos += TOKEN_SIZE
             return self.parse_block()
         else:
-            stmt: Statement = ExpressionStatement(self.parse_expression())
-            self.consume(TokenType.Semicolon, "Expected ';' after expression statement")
+            stmt = ExpressionStatement(self.parse_expression())
+            self.consume(TT_SEMICOLON, "Expected ';' after expression statement")
             return stmt
 
     def parse_module(self) -> ModuleDefinition:
         statements: list[Statement] = []
-        while self.token.type != TokenType.EndOfFile:
+        while self.tokens[self.pos] != TT_END_OF_FILE:
             stmt = self.parse_statement()
             statements.append(stmt)
-        return ModuleDefinition(statements)
\ No newline at end of file
+        return ModuleDefinition(statements)
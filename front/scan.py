@@ -0,0 +1,13 @@
+from string import ascii_letters, digits as ascii_digits
+import typing
+import re
+
+
+IDENTIFIER_CHARS: typing.Final[str] = ascii_letters + ascii_digits + "_"
+
+NUMBER_RE: typing.Final[re.Pattern[bytes]] = re.compile(rb"[0-9_]*")
+IDENTIFIER_RE: typing.Final[re.Pattern[bytes]] = re.compile(rb"[A-Za-z0-9_]*")
+WHITESPACE_RE: typing.Final[re.Pattern[bytes]] = re.compile(rb"[ \t\r\n]*")
+
+
+__all__ = ["IDENTIFIER_CHARS", "NUMBER_RE", "IDENTIFIER_RE", "WHITESPACE_RE"]
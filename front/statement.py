@@ -1,6 +1,7 @@
 import enum
 import typing
-from front.ast import Expression, Statement
+from front.ast import Statement
+from front.expression import Expression
 from front.types import QualifiedType, UnqualifiedType, FunctionType
 
 
@@ -8,28 +9,28 @@ from front.types import QualifiedType, UnqualifiedType, FunctionType
 
 
 class ExpressionStatement(Statement):
-    expr: Expression
+    expr: typing.Optional[Expression]
 
     __slots__ = "expr"
 
-    def __init__(self, e: Expression):
+    def __init__(self, e: typing.Optional[Expression]):
         super().__init__()
         self.expr = e
 
-    def __repr__(self):
+    def __repr__(self) -> str:
         return f"{self.expr};"
 
 
 class ReturnStatement(Statement):
-    expr: Expression
+    expr: typing.Optional[Expression]
 
     __slots__ = "expr"
 
-    def __init__(self, e: Expression):
+    def __init__(self, e: typing.Optional[Expression]):
         super().__init__()
         self.expr = e
 
-    def __repr__(self):
+    def __repr__(self) -> str:
         return f"return {self.expr};"
 
 
@@ -42,7 +43,7 @@ class StatementBlock(Statement):
         super().__init__()
         self.statements = statements
 
-    def __repr__(self):
+    def __repr__(self) -> str:
         strings: list[str] = [repr(x) for x in self.statements]
         strings = ["\n    ".join(s.split("\n")) for s in strings]
         string: str = "\n    ".join(strings)
@@ -50,19 +51,19 @@ class StatementBlock(Statement):
 
 
 class IfStatement(Statement):
-    condition: Expression
+    condition: typing.Optional[Expression]
     if_clause: Statement
-    else_clause: Statement
+    else_clause: typing.Optional[Statement]
 
     __slots__ = "condition", "if_clause", "else_clause"
 
-    def __init__(self, cond: Expression, if_: Statement, else_: Statement):
+    def __init__(self, cond: typing.Optional[Expression], if_: Statement, else_: typing.Optional[Statement]):
         super().__init__()
         self.condition = cond
         self.if_clause = if_
         self.else_clause = else_
 
-    def __repr__(self):
+    def __repr__(self) -> str:
         s: str = f"if({self.condition}) {self.if_clause}"
         if self.else_clause is not None:
             s += f"\nelse {self.else_clause}"
@@ -72,17 +73,17 @@ class IfStatement(Statement):
 class VariableDeclaration(Statement):
     name: str
     qualified_type: QualifiedType
-    initializer: Expression
+    initializer: typing.Optional[Expression]
 
     __slots__ = "name", "qualified_type", "initializer"
 
-    def __init__(self, name: str, tp: QualifiedType, initializer: Expression = None):
+    def __init__(self, name: str, tp: QualifiedType, initializer: typing.Optional[Expression] = None):
         super().__init__()
         self.name = name
         self.qualified_type = tp
         self.initializer = initializer
 
-    def __repr__(self):
+    def __repr__(self) -> str:
         s = f"var {self.name}: {self.qualified_type}"
         if self.initializer is not None:
             return s + f" = {self.initializer};"
@@ -94,11 +95,11 @@ class FunctionDefinition(Statement):
     name: str
     function_type: FunctionType
     arg_names: list[str]
-    code: StatementBlock
+    code: typing.Optional[StatementBlock]
 
     __slots__ = "name", "function_type", "arg_names", "code"
 
-    def __init__(self, name: str, tp: FunctionType, names: list[str], code: StatementBlock):
+    def __init__(self, name: str, tp: FunctionType, names: list[str], code: typing.Optional[StatementBlock]):
         self.name = name
         self.function_type = tp
         self.arg_names = names
@@ -107,7 +108,7 @@ class FunctionDefinition(Statement):
         assert len(self.function_type.arguments) == len(self.arg_names)
         assert self.code is None or isinstance(self.code, StatementBlock)
 
-    def __repr__(self):
+    def __repr__(self) -> str:
         s: str =  f"fn {self.name}("\
                   + ", ".join(f"{arg}: {tp}" for arg, tp in zip(self.arg_names, self.function_type.arguments))\
                   + f") -> {self.function_type.return_type} "
@@ -125,7 +126,7 @@ class ModuleDefinition(Statement):
     def __init__(self, statements: list[Statement]):
         self.statements = statements
 
-    def __repr__(self):
+    def __repr__(self) -> str:
         return "\n".join(repr(x) for x in self.statements)
 
 
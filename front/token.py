@@ -1,245 +1,468 @@
 from enum import IntEnum
 from dataclasses import dataclass
-from string import ascii_letters, digits as ascii_digits
+from string import digits as ascii_digits
+from front.scan import IDENTIFIER_CHARS, NUMBER_RE, IDENTIFIER_RE, WHITESPACE_RE
 import typing
+from typing import Final
 import enum
+import re
+import struct
 import sys
 
 
 
+# Token types as plain ints. Hot paths compare and index with these; TokenType names the same
+# values for debugging and printing.
+TT_ERROR: Final = 1
+TT_END_OF_FILE: Final = 2
+
+TT_LPAREN: Final = 3
+TT_RPAREN: Final = 4
+TT_LBRACE: Final = 5
+TT_RBRACE: Final = 6
+TT_LBRACKET: Final = 7
+TT_RBRACKET: Final = 8
+
+TT_COMMA: Final = 9
+TT_DOT: Final = 10
+TT_SEMICOLON: Final = 11
+TT_COLON: Final = 12
+TT_ARROW: Final = 13
+
+TT_TILDE: Final = 14
+
+TT_EQUAL: Final = 15
+TT_BANG: Final = 16
+TT_PLUS: Final = 17
+TT_MINUS: Final = 18
+TT_STAR: Final = 19
+TT_SLASH: Final = 20
+TT_PERCENT: Final = 21
+TT_AMPERSAND: Final = 22
+TT_PIPE: Final = 23
+TT_CARET: Final = 24
+TT_LSHIFT: Final = 25
+TT_RSHIFT: Final = 26
+TT_GREATER: Final = 27
+TT_LESSER: Final = 28
+
+TT_EQUAL_EQUAL: Final = 29
+TT_BANG_EQUAL: Final = 30
+TT_PLUS_EQUAL: Final = 31
+TT_MINUS_EQUAL: Final = 32
+TT_STAR_EQUAL: Final = 33
+TT_SLASH_EQUAL: Final = 34
+TT_PERCENT_EQUAL: Final = 35
+TT_AMPERSAND_EQUAL: Final = 36
+TT_PIPE_EQUAL: Final = 37
+TT_CARET_EQUAL: Final = 38
+TT_LSHIFT_EQUAL: Final = 39
+TT_RSHIFT_EQUAL: Final = 40
+TT_GREATER_EQUAL: Final = 41
+TT_LESSER_EQUAL: Final = 42
+
+TT_IDENTIFIER: Final = 43
+TT_BOOL_LITERAL: Final = 44
+TT_INT_LITERAL: Final = 45
+TT_FLOAT_LITERAL: Final = 46
+TT_STRING_LITERAL: Final = 47
+
+TT_AND_KW: Final = 48
+TT_OR_KW: Final = 49
+TT_NOT_KW: Final = 50
+TT_RETURN_KW: Final = 51
+TT_IF_KW: Final = 52
+TT_ELSE_KW: Final = 53
+TT_VAR_KW: Final = 54
+TT_FN_KW: Final = 55
+
+
 class TokenType(IntEnum):
-    Error = enum.auto()
-    EndOfFile = enum.auto()
-
-    LParen = enum.auto()
-    RParen = enum.auto()
-    LBrace = enum.auto()
-    RBrace = enum.auto()
-    LBracket = enum.auto()
-    RBracket = enum.auto()
-
-    Comma = enum.auto()
-    Dot = enum.auto()
-    Semicolon = enum.auto()
-    Colon = enum.auto()
-    Arrow = enum.auto()
-
-    Tilde = enum.auto()
-
-    Equal = enum.auto()
-    Bang = enum.auto()
-    Plus = enum.auto()
-    Minus = enum.auto()
-    Star = enum.auto()
-    Slash = enum.auto()
-    Percent = enum.auto()
-    Ampersand = enum.auto()
-    Pipe = enum.auto()
-    Caret = enum.auto()
-    LShift = enum.auto()
-    RShift = enum.auto()
-    Greater = enum.auto()
-    Lesser = enum.auto()
-
-    EqualEqual = enum.auto()
-    BangEqual = enum.auto()
-    PlusEqual = enum.auto()
-    MinusEqual = enum.auto()
-    StarEqual = enum.auto()
-    SlashEqual = enum.auto()
-    PercentEqual = enum.auto()
-    AmpersandEqual = enum.auto()
-    PipeEqual = enum.auto()
-    CaretEqual = enum.auto()
-    LShiftEqual = enum.auto()
-    RShiftEqual = enum.auto()
-    GreaterEqual = enum.auto()
-    LesserEqual = enum.auto()
-
-    Identifier = enum.auto()
-    BoolLiteral = enum.auto()
-    IntLiteral = enum.auto()
-    FloatLiteral = enum.auto()
-    StringLiteral = enum.auto()
-
-    AndKW = enum.auto()
-    OrKW = enum.auto()
-    NotKW = enum.auto()
-    ReturnKW = enum.auto()
-    IfKW = enum.auto()
-    ElseKW = enum.auto()
-    VarKW = enum.auto()
-    FnKW = enum.auto()
+    Error = TT_ERROR
+    EndOfFile = TT_END_OF_FILE
+
+    LParen = TT_LPAREN
+    RParen = TT_RPAREN
+    LBrace = TT_LBRACE
+    RBrace = TT_RBRACE
+    LBracket = TT_LBRACKET
+    RBracket = TT_RBRACKET
+
+    Comma = TT_COMMA
+    Dot = TT_DOT
+    Semicolon = TT_SEMICOLON
+    Colon = TT_COLON
+    Arrow = TT_ARROW
+
+    Tilde = TT_TILDE
+
+    Equal = TT_EQUAL
+    Bang = TT_BANG
+    Plus = TT_PLUS
+    Minus = TT_MINUS
+    Star = TT_STAR
+    Slash = TT_SLASH
+    Percent = TT_PERCENT
+    Ampersand = TT_AMPERSAND
+    Pipe = TT_PIPE
+    Caret = TT_CARET
+    LShift = TT_LSHIFT
+    RShift = TT_RSHIFT
+    Greater = TT_GREATER
+    Lesser = TT_LESSER
+
+    EqualEqual = TT_EQUAL_EQUAL
+    BangEqual = TT_BANG_EQUAL
+    PlusEqual = TT_PLUS_EQUAL
+    MinusEqual = TT_MINUS_EQUAL
+    StarEqual = TT_STAR_EQUAL
+    SlashEqual = TT_SLASH_EQUAL
+    PercentEqual = TT_PERCENT_EQUAL
+    AmpersandEqual = TT_AMPERSAND_EQUAL
+    PipeEqual = TT_PIPE_EQUAL
+    CaretEqual = TT_CARET_EQUAL
+    LShiftEqual = TT_LSHIFT_EQUAL
+    RShiftEqual = TT_RSHIFT_EQUAL
+    GreaterEqual = TT_GREATER_EQUAL
+    LesserEqual = TT_LESSER_EQUAL
+
+    Identifier = TT_IDENTIFIER
+    BoolLiteral = TT_BOOL_LITERAL
+    IntLiteral = TT_INT_LITERAL
+    FloatLiteral = TT_FLOAT_LITERAL
+    StringLiteral = TT_STRING_LITERAL
+
+    AndKW = TT_AND_KW
+    OrKW = TT_OR_KW
+    NotKW = TT_NOT_KW
+    ReturnKW = TT_RETURN_KW
+    IfKW = TT_IF_KW
+    ElseKW = TT_ELSE_KW
+    VarKW = TT_VAR_KW
+    FnKW = TT_FN_KW
 
     def __repr__(self):
         return str(self)[10:]
 
 
-@dataclass
+@dataclass(slots=True)
 class UnknownCharacterError:
     char: str
 
-    __slots__ = "char"
-
     def __repr__(self):
         return f"UnknownChar('{self.char}')"
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
-    type: TokenType
+    type: int
     value: typing.Any
     line: int
 
-    __slots__ = "type", "value", "line"
-
     def __bool__(self) -> bool:
-        return self.type > TokenType.EndOfFile
+        return self.type > TT_END_OF_FILE
+
+
+SINGLE_CHAR_LITERALS: Final[dict[str, int]] = {
+    "(": TT_LPAREN, ")": TT_RPAREN,
+    "[": TT_LBRACKET, "]": TT_RBRACKET,
+    "{": TT_LBRACE, "}": TT_RBRACE,
+    ",": TT_COMMA, ".": TT_DOT,
+    ";": TT_SEMICOLON, ":": TT_COLON,
+    "~": TT_TILDE
+}
+KEYWORD_MAP: Final[dict[str, int]] = {
+    "and": TT_AND_KW, "or": TT_OR_KW,
+    "not": TT_NOT_KW, "return": TT_RETURN_KW,
+    "if": TT_IF_KW, "else": TT_ELSE_KW,
+    "var": TT_VAR_KW, "fn": TT_FN_KW
+}
+# Keywords keyed by their ASCII bytes packed little-endian into an int, so recognizing one
+# hashes a small int rather than a string. Identifiers never contain NUL, so no two collide.
+KEYWORD_MAX_LENGTH: Final[int] = max(len(kw) for kw in KEYWORD_MAP)
+KEYWORD_CODES: Final[dict[int, int]] = {
+    int.from_bytes(kw.encode("ascii"), "little"): tp for kw, tp in KEYWORD_MAP.items()
+}
+REGULAR_OPERATORS: Final[dict[str, tuple[int, int]]] = {
+    "+": (TT_PLUS, TT_PLUS_EQUAL),
+    "*": (TT_STAR, TT_STAR_EQUAL),
+    "/": (TT_SLASH, TT_SLASH_EQUAL),
+    "%": (TT_PERCENT, TT_PERCENT_EQUAL),
+    "&": (TT_AMPERSAND, TT_AMPERSAND_EQUAL),
+    "|": (TT_PIPE, TT_PIPE_EQUAL),
+    "^": (TT_CARET, TT_CARET_EQUAL),
+    "!": (TT_BANG, TT_BANG_EQUAL),
+    "=": (TT_EQUAL, TT_EQUAL_EQUAL)
+}
+
+
+ORD_EQUAL: Final[int] = ord("=")
+ORD_GREATER: Final[int] = ord(">")
+ORD_LESSER: Final[int] = ord("<")
+ORD_NEWLINE: Final[int] = ord("\n")
+
+# Character categories, indexed by source byte through DISPATCH.
+CAT_ERROR: Final[int] = 0
+CAT_SINGLE: Final[int] = 1
+CAT_DIGIT: Final[int] = 2
+CAT_ALPHA: Final[int] = 3
+CAT_OPERATOR: Final[int] = 4
+CAT_QUOTE: Final[int] = 5
+CAT_MINUS: Final[int] = 6
+CAT_GREATER: Final[int] = 7
+CAT_LESSER: Final[int] = 8
+CAT_NON_ASCII: Final[int] = 9
+
+
+def build_dispatch_tables() -> tuple[list[int], list[int], list[tuple[int, int]]]:
+    # Bytes without a single-character token or operator pair map to TT_ERROR; the dispatch
+    # category guarantees those entries are never read.
+    dispatch: list[int] = [CAT_ERROR] * 256
+    singles: list[int] = [TT_ERROR] * 256
+    operators: list[tuple[int, int]] = [(TT_ERROR, TT_ERROR)] * 256
+
+    for c, tp in SINGLE_CHAR_LITERALS.items():
+        dispatch[ord(c)] = CAT_SINGLE
+        singles[ord(c)] = tp
+    for c, pair in REGULAR_OPERATORS.items():
+        dispatch[ord(c)] = CAT_OPERATOR
+        operators[ord(c)] = pair
+    for c in ascii_digits:
+        dispatch[ord(c)] = CAT_DIGIT
+    for c in IDENTIFIER_CHARS:
+        if dispatch[ord(c)] == CAT_ERROR:
+            dispatch[ord(c)] = CAT_ALPHA
+
+    dispatch[ord("'")] = CAT_QUOTE
+    dispatch[ord('"')] = CAT_QUOTE
+    dispatch[ord("-")] = CAT_MINUS
+    dispatch[ORD_GREATER] = CAT_GREATER
+    dispatch[ORD_LESSER] = CAT_LESSER
+    for b in range(0x80, 0x100):
+        dispatch[b] = CAT_NON_ASCII
+    return dispatch, singles, operators
+
+
+DISPATCH, SINGLE_CHAR_TABLE, OPERATOR_TABLE = build_dispatch_tables()
+
+
+def utf8_sequence_length(lead: int) -> int:
+    if lead >= 0xF0:
+        return 4
+    elif lead >= 0xE0:
+        return 3
+    elif lead >= 0xC0:
+        return 2
+    return 1
 
 
 class Tokenizer:
-    source: str
+    buf: bytes
     idx: int
     line: int
+    # Returned tokens are recycled: a token stays valid until the tokenizer has been called twice more.
+    scratch: tuple[Token, Token]
+    scratch_idx: int
 
-    __slots__ = "source", "idx", "line"
-
-    single_char_literals: dict[str, TokenType] = {
-        "(": TokenType.LParen, ")": TokenType.RParen,
-        "[": TokenType.LBracket, "]": TokenType.RBracket,
-        "{": TokenType.LBrace, "}": TokenType.RBrace,
-        ",": TokenType.Comma, ".": TokenType.Dot,
-        ";": TokenType.Semicolon, ":": TokenType.Colon,
-        "~": TokenType.Tilde
-    }
-    keyword_map: dict[str, TokenType] = {
-        "and": TokenType.AndKW, "or": TokenType.OrKW,
-        "not": TokenType.NotKW, "return": TokenType.ReturnKW,
-        "if": TokenType.IfKW, "else": TokenType.ElseKW,
-        "var": TokenType.VarKW, "fn": TokenType.FnKW
-    }
-    regular_operators: dict[str, tuple[TokenType, TokenType]] = {
-        "+": (TokenType.Plus, TokenType.PlusEqual),
-        "*": (TokenType.Star, TokenType.StarEqual),
-        "/": (TokenType.Slash, TokenType.SlashEqual),
-        "%": (TokenType.Percent, TokenType.PercentEqual),
-        "&": (TokenType.Ampersand, TokenType.AmpersandEqual),
-        "|": (TokenType.Pipe, TokenType.PipeEqual),
-        "^": (TokenType.Caret, TokenType.CaretEqual),
-        "!": (TokenType.Bang, TokenType.BangEqual),
-        "=": (TokenType.Equal, TokenType.EqualEqual)
-    }
-
-    number_chars: str = "0123456789_"
-    identifier_chars: str = ascii_letters + ascii_digits + "_"
-
+    __slots__ = "buf", "idx", "line", "scratch", "scratch_idx"
 
     def __init__(self, text: str):
-        self.source = text
+        self.buf = text.encode("utf-8")
         self.idx = 0
         self.line = 0
-
-    def match(self, c: str) -> bool:
-        if self.idx < len(self.source) and self.source[self.idx] == c:
-            self.idx += 1
+        self.scratch = (Token(TT_ERROR, None, 0), Token(TT_ERROR, None, 0))
+        self.scratch_idx = 0
+
+    def fill(self, tp: int, value: typing.Any, line: int) -> Token:
+        t: Token = self.scratch[self.scratch_idx]
+        self.scratch_idx ^= 1
+        t.type = tp
+        t.value = value
+        t.line = line
+        return t
+
+    def match(self, c: int) -> bool:
+        buf: bytes = self.buf
+        i: int = self.idx
+        if i < len(buf) and buf[i] == c:
+            self.idx = i + 1
             return True
         else:
             return False
 
 
     def __call__(self) -> Token:
-        while self.idx < len(self.source):
-            c = self.source[self.idx]
-            line = self.line
-            self.idx += 1
-
-            if c == ' ':
-                continue
-            elif c == '\n':
-                self.line += 1
-            elif c in self.single_char_literals:
-                return Token(self.single_char_literals[c], None, line)
-            elif c.isdigit():
-                return self.tokenize_number()
-            elif c.isalpha() or c == '_':
+        buf: bytes = self.buf
+        n: int = len(buf)
+        idx: int = self.idx
+        # Most tokens are followed by nothing or a single space, so only longer runs go through the regex.
+        if idx < n and buf[idx] <= 32:
+            if buf[idx] == 32 and (idx + 1 == n or buf[idx + 1] > 32):
+                idx += 1
+            else:
+                ws: typing.Optional[re.Match[bytes]] = WHITESPACE_RE.match(buf, idx)
+                assert ws is not None  # the pattern matches the empty string
+                end: int = ws.end()
+                self.line += buf.count(b"\n", idx, end)
+                idx = end
+
+        if idx < n:
+            b: int = buf[idx]
+            cat: int = DISPATCH[b]
+            self.idx = idx + 1
+            if cat == CAT_SINGLE:
+                return self.fill(SINGLE_CHAR_TABLE[b], None, self.line)
+            elif cat == CAT_ALPHA:
                 return self.tokenize_identifier()
-            elif c == '\'' or c == '"':
-                return self.tokenize_string()
-
-            if c in self.regular_operators:
-                t: tuple[TokenType, TokenType] = self.regular_operators[c]
-                if self.match('='):
-                    return Token(t[1], None, self.line)
+            elif cat == CAT_DIGIT:
+                return self.tokenize_number()
+            elif cat == CAT_OPERATOR:
+                t: tuple[int, int] = OPERATOR_TABLE[b]
+                if self.match(ORD_EQUAL):
+                    return self.fill(t[1], None, self.line)
                 else:
-                    return Token(t[0], None, self.line)
-            elif c == '-':
-                if self.match(">"):
-                    return Token(TokenType.Arrow, None, self.line)
-                elif self.match("="):
-                    return Token(TokenType.MinusEqual, None, self.line)
+                    return self.fill(t[0], None, self.line)
+            elif cat == CAT_QUOTE:
+                return self.tokenize_string()
+            elif cat == CAT_MINUS:
+                if self.match(ORD_GREATER):
+                    return self.fill(TT_ARROW, None, self.line)
+                elif self.match(ORD_EQUAL):
+                    return self.fill(TT_MINUS_EQUAL, None, self.line)
                 else:
-                    return Token(TokenType.Minus, None, self.line)
-            elif c == '>':
-                if self.match(">"):
-                    if self.match("="):
-                        return Token(TokenType.RShiftEqual, None, self.line)
+                    return self.fill(TT_MINUS, None, self.line)
+            elif cat == CAT_GREATER:
+                if self.match(ORD_GREATER):
+                    if self.match(ORD_EQUAL):
+                        return self.fill(TT_RSHIFT_EQUAL, None, self.line)
                     else:
-                        return Token(TokenType.RShift, None, self.line)
-                elif self.match("="):
-                    return Token(TokenType.GreaterEqual, None, self.line)
+                        return self.fill(TT_RSHIFT, None, self.line)
+                elif self.match(ORD_EQUAL):
+                    return self.fill(TT_GREATER_EQUAL, None, self.line)
                 else:
-                    return Token(TokenType.Greater, None, self.line)
-
-            elif c == '<':
-                if self.match("<"):
-                    if self.match("="):
-                        return Token(TokenType.LShiftEqual, None, self.line)
+                    return self.fill(TT_GREATER, None, self.line)
+            elif cat == CAT_LESSER:
+                if self.match(ORD_LESSER):
+                    if self.match(ORD_EQUAL):
+                        return self.fill(TT_LSHIFT_EQUAL, None, self.line)
                     else:
-                        return Token(TokenType.LShift, None, self.line)
-                elif self.match("="):
-                    return Token(TokenType.LesserEqual, None, self.line)
+                        return self.fill(TT_LSHIFT, None, self.line)
+                elif self.match(ORD_EQUAL):
+                    return self.fill(TT_LESSER_EQUAL, None, self.line)
                 else:
-                    return Token(TokenType.Lesser, None, self.line)
-
+                    return self.fill(TT_LESSER, None, self.line)
+            elif cat == CAT_NON_ASCII:
+                return self.tokenize_non_ascii()
             else:
-                return Token(TokenType.Error, UnknownCharacterError(c), self.line)
+                return self.fill(TT_ERROR, UnknownCharacterError(chr(b)), self.line)
 
-        return Token(TokenType.EndOfFile, self.idx, self.line)
+        self.idx = idx
+        return self.fill(TT_END_OF_FILE, self.idx, self.line)
 
 
     def tokenize_number(self) -> Token:
         start_idx: int = self.idx - 1
-        while self.idx < len(self.source) and self.source[self.idx] in self.number_chars:
-            self.idx += 1
+        m: typing.Optional[re.Match[bytes]] = NUMBER_RE.match(self.buf, self.idx)
+        assert m is not None
+        i: int = m.end()
+        self.idx = i
 
-        number: int = int(self.source[start_idx:self.idx])
-        return Token(TokenType.IntLiteral, number, self.line)
+        number: int = int(self.buf[start_idx:i])
+        return self.fill(TT_INT_LITERAL, number, self.line)
 
     def tokenize_identifier(self) -> Token:
         start_idx: int = self.idx - 1
-        while self.idx < len(self.source) and self.source[self.idx] in self.identifier_chars:
-            self.idx += 1
-
-        text: str = self.source[start_idx:self.idx]
-        if text in self.keyword_map:
-            return Token(self.keyword_map[text], None, self.line)
+        m: typing.Optional[re.Match[bytes]] = IDENTIFIER_RE.match(self.buf, self.idx)
+        assert m is not None
+        i: int = m.end()
+        self.idx = i
+
+        raw: bytes = self.buf[start_idx:i]
+        if i - start_idx <= KEYWORD_MAX_LENGTH:
+            kw: typing.Optional[int] = KEYWORD_CODES.get(int.from_bytes(raw, "little"))
+            if kw is not None:
+                return self.fill(kw, None, self.line)
+        return self.fill(TT_IDENTIFIER, sys.intern(raw.decode("ascii")), self.line)
+
+    def tokenize_non_ascii(self) -> Token:
+        # Like the ASCII path, a digit or letter may start a number or identifier, but only ASCII
+        # characters continue it.
+        buf: bytes = self.buf
+        start_idx: int = self.idx - 1
+        end: int = min(start_idx + utf8_sequence_length(buf[start_idx]), len(buf))
+        c: str = buf[start_idx:end].decode("utf-8", "replace")
+        if c.isdigit():
+            m: typing.Optional[re.Match[bytes]] = NUMBER_RE.match(buf, end)
+            assert m is not None
+            i: int = m.end()
+            try:
+                number: int = int(buf[start_idx:i].decode("utf-8"))
+            except ValueError:
+                # Digits without a decimal value, such as superscripts.
+                self.idx = end
+                return self.fill(TT_ERROR, UnknownCharacterError(c), self.line)
+            self.idx = i
+            return self.fill(TT_INT_LITERAL, number, self.line)
+        elif c.isalpha():
+            m = IDENTIFIER_RE.match(buf, end)
+            assert m is not None
+            i = m.end()
+            self.idx = i
+            return self.fill(TT_IDENTIFIER, sys.intern(buf[start_idx:i].decode("utf-8")), self.line)
         else:
-            return Token(TokenType.Identifier, sys.intern(text), self.line)
+            self.idx = end
+            return self.fill(TT_ERROR, UnknownCharacterError(c), self.line)
 
     def tokenize_string(self) -> Token:
-        close: str = self.source[self.idx - 1]
+        buf: bytes = self.buf
+        n: int = len(buf)
+        close: int = buf[self.idx - 1]
         start_idx: int = self.idx
         start_line: int = self.line
-        while self.idx < len(self.source) and self.source[self.idx] != close:
-            if self.source[self.idx] == '\n':
+        i: int = self.idx
+        while i < n and buf[i] != close:
+            if buf[i] == ORD_NEWLINE:
                 self.line += 1
-            self.idx += 1
-        self.idx += 1
+            i += 1
+        self.idx = i + 1
 
-        text: str = self.source[start_idx:self.idx - 1]
-        return Token(TokenType.StringLiteral, text, start_line)
+        text: str = buf[start_idx:i].decode("utf-8")
+        return self.fill(TT_STRING_LITERAL, text, start_line)
+
+
+# Tokens produced by tokenize_all are packed into fixed-size records of
+# (type, index into the value pool, line). Index 0 of the pool is always None.
+TOKEN_RECORD: Final[struct.Struct] = struct.Struct("<BxxxIi")
+TOKEN_SIZE: Final[int] = TOKEN_RECORD.size
+
+
+def tokenize_all(text: str) -> tuple[bytearray, list[typing.Any]]:
+    """Tokenizes text up to and including the EndOfFile token into TOKEN_RECORDs and their value pool."""
+    tokens: bytearray = bytearray()
+    values: list[typing.Any] = [None]
+    pack = TOKEN_RECORD.pack
+    tokenizer: Tokenizer = Tokenizer(text)
+    while True:
+        t: Token = tokenizer()
+        if t.value is None:
+            tokens += pack(t.type, 0, t.line)
+        else:
+            tokens += pack(t.type, len(values), t.line)
+            values.append(t.value)
+        if t.type == TT_END_OF_FILE:
+            return tokens, values
 
 
 __all__ = (
-    "TokenType", "Token", "Tokenizer", "UnknownCharacterError"
+    "TokenType", "Token", "Tokenizer", "UnknownCharacterError",
+    "TOKEN_RECORD", "TOKEN_SIZE", "tokenize_all",
+    "TT_ERROR", "TT_END_OF_FILE", "TT_LPAREN", "TT_RPAREN", "TT_LBRACE", "TT_RBRACE", "TT_LBRACKET",
+    "TT_RBRACKET", "TT_COMMA", "TT_DOT", "TT_SEMICOLON", "TT_COLON", "TT_ARROW", "TT_TILDE",
+    "TT_EQUAL", "TT_BANG", "TT_PLUS", "TT_MINUS", "TT_STAR", "TT_SLASH", "TT_PERCENT",
+    "TT_AMPERSAND", "TT_PIPE", "TT_CARET", "TT_LSHIFT", "TT_RSHIFT", "TT_GREATER", "TT_LESSER",
+    "TT_EQUAL_EQUAL", "TT_BANG_EQUAL", "TT_PLUS_EQUAL", "TT_MINUS_EQUAL", "TT_STAR_EQUAL",
+    "TT_SLASH_EQUAL", "TT_PERCENT_EQUAL", "TT_AMPERSAND_EQUAL", "TT_PIPE_EQUAL", "TT_CARET_EQUAL",
+    "TT_LSHIFT_EQUAL", "TT_RSHIFT_EQUAL", "TT_GREATER_EQUAL", "TT_LESSER_EQUAL", "TT_IDENTIFIER",
+    "TT_BOOL_LITERAL", "TT_INT_LITERAL", "TT_FLOAT_LITERAL", "TT_STRING_LITERAL", "TT_AND_KW",
+    "TT_OR_KW", "TT_NOT_KW", "TT_RETURN_KW", "TT_IF_KW", "TT_ELSE_KW", "TT_VAR_KW", "TT_FN_KW"
 )
\ No newline at end of file
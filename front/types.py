@@ -1,3 +1,5 @@
+from typing import Final
+
 
 class UnqualifiedType:
 
@@ -13,10 +15,10 @@ class UnqualifiedType:
 
 class QualifiedType:
 
-    Reference = 1 << 0
-    Constant = 1 << 1
+    Reference: Final = 1 << 0
+    Constant: Final = 1 << 1
 
-    ConstReference = Reference | Constant
+    ConstReference: Final = Reference | Constant
 
     unqualified: UnqualifiedType
     flags: int
@@ -32,7 +34,7 @@ class QualifiedType:
         return bool(self.flags & self.Reference)
 
     @property
-    def is_const(self):
+    def is_const(self) -> bool:
         return bool(self.flags & self.Constant)
 
     def sizeof(self) -> int:
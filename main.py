@@ -4,5 +4,7 @@ from front.statement import *
 from front.types import *
 
 p = Parser("fn func(a: i32, b: i32) -> i32 { var c: i32 = a + b; return c * c + a * b; }")
-print(p.parse_module(), "\n") # Print syntax tree
+with gc_paused():
+    tree = p.parse_module()
+print(tree, "\n") # Print syntax tree
 print(p.errors) # Print errors
@@ -0,0 +1,17 @@
+from setuptools import setup
+from mypyc.build import mypycify
+
+
+setup(
+    name="simple-parser",
+    packages=["front"],
+    ext_modules=mypycify([
+        "front/ast.py",
+        "front/types.py",
+        "front/expression.py",
+        "front/statement.py",
+        "front/scan.py",
+        "front/token.py",
+        "front/parser.py",
+    ]),
+)